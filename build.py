@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""Build helper for the ManV standard library.
+
+Validates the module layout, smoke-builds the examples and drives
+`manv build` for the package itself. Intended for contributors and CI;
+end users only need `manv build` as described in the README.
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePath
+from typing import Dict, List, Optional, Tuple
+
+# rich is only worth its import cost when the output is a terminal that
+# will render the colors; piped CI output skips it. NO_COLOR is the
+# https://no-color.org/ convention.
+HAS_RICH = False
+if sys.stdout.isatty() and os.environ.get("NO_COLOR") is None:
+    try:
+        from rich import print
+        HAS_RICH = True
+    except ImportError:
+        pass
+
+STDLIB_DIR = Path(__file__).resolve().parent
+SRC_DIR = STDLIB_DIR / "src"
+EXAMPLES_DIR = STDLIB_DIR / "examples"
+BUILD_DIR = STDLIB_DIR / "build"
+
+# Curated module set, mirroring the includes in src/mod.mv plus the
+# grouped submodules they pull in. Paths are relative to src/. The
+# names are interned so the dicts keyed by them compare by pointer.
+MODULES: Tuple[str, ...] = tuple(sys.intern(m) for m in (
+    "mod.mv",
+    "types.mv",
+    "prelude.mv",
+    "core.mv",
+    "option.mv",
+    "result.mv",
+    "assert.mv",
+    "test.mv",
+    "num/mod.mv",
+    "num/int.mv",
+    "num/uint.mv",
+    "num/byte.mv",
+    "num/float.mv",
+    "string/mod.mv",
+    "string/str.mv",
+    "string/string.mv",
+    "collections/mod.mv",
+    "collections/map.mv",
+    "collections/array_dynamic.mv",
+    "collections/array_static.mv",
+    "mem/mod.mv",
+    "mem/alloc.mv",
+    "mem/arena.mv",
+    "mem/buffer.mv",
+    "mem/gc.mv",
+))
+
+DEPENDENCIES = ["manv", "git"]
+
+# Absolute tool paths resolved by check_dependencies, so spawning the
+# tools later bypasses the PATH search in the child.
+TOOL_PATHS: Dict[str, str] = {}
+
+
+def tool(name: str) -> str:
+    return TOOL_PATHS.get(name, name)
+
+
+# Prefixes and formats picked once at import time, so the log helpers
+# need no HAS_RICH branch per call and the plain fallback never emits
+# rich markup literally.
+if HAS_RICH:
+    _INFO_PREFIX = "[bold green][INFO][/bold green]"
+    _ERROR_PREFIX = "[bold red][ERROR][/bold red]"
+    _CMD_FORMAT = "[dim]$ {}[/dim]"
+else:
+    _INFO_PREFIX = "[INFO]"
+    _ERROR_PREFIX = "[ERROR]"
+    _CMD_FORMAT = "$ {}"
+
+
+def log_info(message: str) -> None:
+    print(f"{_INFO_PREFIX} {message}")
+
+
+def log_error(message: str) -> None:
+    print(f"{_ERROR_PREFIX} {message}")
+
+
+def log_cmd(command: List[str]) -> None:
+    print(_CMD_FORMAT.format(" ".join(command)))
+
+
+def run_command(command: List[str], verbose: bool = False) -> bool:
+    """Run a command, returning True on a zero exit status.
+
+    The child is started with os.posix_spawn rather than subprocess, so
+    the kernel can use vfork semantics instead of duplicating this
+    process's page tables on every spawn. Stdout is inherited when
+    verbose and discarded otherwise; stderr is captured as bytes and
+    only decoded when the command fails.
+    """
+    if verbose:
+        log_cmd(command)
+    executable = command[0]
+    if not os.path.isabs(executable):
+        executable = shutil.which(executable) or executable
+    err_read, err_write = os.pipe()
+    file_actions = [
+        (os.POSIX_SPAWN_DUP2, err_write, 2),
+        (os.POSIX_SPAWN_CLOSE, err_read),
+    ]
+    if not verbose:
+        file_actions.insert(
+            0, (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0o644)
+        )
+    try:
+        pid = os.posix_spawn(
+            executable, command, os.environ, file_actions=file_actions
+        )
+    except OSError as exc:
+        os.close(err_read)
+        os.close(err_write)
+        log_error(f"failed to spawn {command[0]}: {exc}")
+        return False
+    os.close(err_write)
+    chunks = []
+    while True:
+        chunk = os.read(err_read, 65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    os.close(err_read)
+    _, status = os.waitpid(pid, 0)
+    if os.waitstatus_to_exitcode(status) != 0:
+        log_error(f"command failed: {' '.join(command)}")
+        stderr = b"".join(chunks)
+        if stderr:
+            print(stderr.decode(errors="replace"), file=sys.stderr)
+        return False
+    return True
+
+
+def check_dependencies() -> bool:
+    """Check that the required tools are available on PATH."""
+    all_found = True
+    for dep in DEPENDENCIES:
+        path = shutil.which(dep)
+        if path is None:
+            log_error(f"required tool not found on PATH: {dep}")
+            all_found = False
+        else:
+            TOOL_PATHS[dep] = path
+    return all_found
+
+
+def validate_modules(verbose: bool = False) -> Dict[str, Optional[os.stat_result]]:
+    """Check that every curated module file exists under src/.
+
+    Modules are grouped by parent directory and checked against one
+    scandir listing per directory, instead of one stat per module.
+    Returns a mapping from module to its stat result (None when the
+    module is missing), so callers reuse the results instead of
+    re-statting the same files.
+    """
+    groups: Dict[Path, List[Tuple[str, str]]] = defaultdict(list)
+    for module in MODULES:
+        path = PurePath(module)
+        groups[SRC_DIR / path.parent].append((path.name, module))
+    stats: Dict[str, Optional[os.stat_result]] = dict.fromkeys(MODULES)
+    for parent, entries in groups.items():
+        wanted = {name for name, _ in entries}
+        found: Dict[str, os.stat_result] = {}
+        try:
+            with os.scandir(parent) as it:
+                for entry in it:
+                    if entry.name in wanted:
+                        found[entry.name] = entry.stat()
+        except FileNotFoundError:
+            pass
+        for name, module in entries:
+            if name in found:
+                stats[module] = found[name]
+                if verbose:
+                    log_info(f"found module: {module}")
+            else:
+                log_error(f"missing module: {module}")
+    return stats
+
+
+def check_old_files() -> List[Path]:
+    """Warn about stale files left over from earlier toolchain revisions.
+
+    A single scandir walk checks both suffixes per entry, rather than
+    one recursive glob per extension re-statting every directory.
+    """
+    old_files = []
+    stack = [SRC_DIR]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.name.endswith((".mvh", ".asm")):
+                    old_files.append(Path(entry.path))
+    for old in old_files:
+        log_error(f"stale file, remove it: {old.relative_to(STDLIB_DIR)}")
+    return old_files
+
+
+def generate_module_info() -> None:
+    """Write the module manifest consumed by downstream tooling.
+
+    The content is built as one string and written in a single call.
+    An unchanged manifest is not rewritten, preserving its mtime for
+    make-style consumers.
+    """
+    BUILD_DIR.mkdir(exist_ok=True)
+    info_path = BUILD_DIR / "modules.txt"
+    content = (
+        "# ManV Standard Library Modules\n"
+        "# Auto-generated by build.py\n"
+        "\n" + "\n".join(MODULES) + "\n"
+    )
+    try:
+        if info_path.read_text() == content:
+            return
+    except OSError:
+        pass
+    info_path.write_text(content)
+    log_info(f"wrote {info_path.relative_to(STDLIB_DIR)}")
+
+
+def source_hash(source) -> str:
+    """Content hash of a source file, for cache keys."""
+    with open(source, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def stored_hash(hash_path) -> str:
+    try:
+        with open(hash_path) as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+def compile_example(source: str, output: str, verbose: bool = False) -> bool:
+    """Smoke-build one example program into build/examples/.
+
+    The source's content hash is kept in a sidecar file next to the
+    output, so the build is also skipped when git has churned the mtime
+    without changing the content (branch switches, fresh checkouts).
+    Paths are plain strings; the caller precomputes them once.
+    """
+    digest = source_hash(source)
+    hash_path = output + ".hash"
+    try:
+        out_st = os.stat(output)
+    except OSError:
+        out_st = None
+    # The size check guards against an interrupted build leaving an
+    # empty output behind with a fresh timestamp.
+    if (
+        out_st is not None
+        and out_st.st_size > 0
+        and (
+            out_st.st_mtime_ns >= os.stat(source).st_mtime_ns
+            or stored_hash(hash_path) == digest
+        )
+    ):
+        if verbose:
+            log_info(f"up-to-date: {os.path.basename(source)}")
+        return True
+    if not run_command(
+        [tool("manv"), "build", source, "-o", output], verbose=verbose
+    ):
+        return False
+    with open(hash_path, "w") as f:
+        f.write(digest)
+    return True
+
+
+def write_examples_makefile(pairs: List[Tuple[str, str]]) -> Path:
+    """Generate a makefile fragment with one rule per example."""
+    makefile = BUILD_DIR / "examples.mk"
+    manv = tool("manv")
+    rules = [
+        f"{out}: {src}\n\t{manv} build $< -o $@\n" for src, out in pairs
+    ]
+    makefile.write_text(
+        "all: " + " ".join(out for _, out in pairs) + "\n\n" + "\n".join(rules)
+    )
+    return makefile
+
+
+def build_examples(verbose: bool = False) -> bool:
+    """Smoke-build every example, in parallel across available cores.
+
+    When make is installed, the builds are delegated to a generated
+    makefile run with -j: one make process replaces a manv spawn per
+    file from Python, and make's own mtime checks handle incremental
+    skips. Otherwise each example is submitted to a thread pool; the
+    work is out-of-process, so threads suffice, and the first failure
+    cancels the remaining tasks.
+    """
+    out_dir = BUILD_DIR / "examples"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    sources = sorted(EXAMPLES_DIR.glob("*.mv"))
+    if not sources:
+        log_info("no examples to build")
+        return True
+    # Precompute plain string paths once, outside the per-file work.
+    out_prefix = f"{out_dir}{os.sep}"
+    pairs = [(str(src), out_prefix + src.stem) for src in sources]
+    make = shutil.which("make")
+    if make is not None:
+        makefile = write_examples_makefile(pairs)
+        if not run_command(
+            [make, "-j", str(os.cpu_count()), "-f", str(makefile), "all"],
+            verbose=verbose,
+        ):
+            return False
+        log_info(f"built {len(pairs)} examples")
+        return True
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        futures = {
+            ex.submit(compile_example, src, out, verbose): src
+            for src, out in pairs
+        }
+        for future in as_completed(futures):
+            if not future.result():
+                log_error(
+                    f"example failed: {os.path.basename(futures[future])}"
+                )
+                ex.shutdown(cancel_futures=True)
+                return False
+    log_info(f"built {len(pairs)} examples")
+    return True
+
+
+def build_library(verbose: bool = False) -> bool:
+    """Build the std package itself via `manv build`.
+
+    A stamp file records the aggregate content hash of the sources at
+    the last successful build. The build is skipped when no source is
+    newer than the stamp (fast path, no reads) or when the aggregate
+    hash still matches (survives mtime churn from git checkouts).
+    """
+    stamp = BUILD_DIR / ".build-stamp"
+    sources = sorted(SRC_DIR.glob("**/*.mv")) + [STDLIB_DIR / "project.toml"]
+    newest_ns = max(s.stat().st_mtime_ns for s in sources)
+    if stamp.exists() and stamp.stat().st_mtime_ns >= newest_ns:
+        if verbose:
+            log_info("library up-to-date")
+        return True
+    aggregate = hashlib.blake2b(
+        "\n".join(source_hash(s) for s in sources).encode(), digest_size=16
+    ).hexdigest()
+    if stored_hash(stamp) == aggregate:
+        stamp.touch()
+        if verbose:
+            log_info("library up-to-date")
+        return True
+    if not run_command([tool("manv"), "build"], verbose=verbose):
+        return False
+    BUILD_DIR.mkdir(exist_ok=True)
+    stamp.write_text(aggregate)
+    return True
+
+
+def clean_build() -> None:
+    """Remove build artifacts.
+
+    The artifact list is snapshotted first, then the unlinks are issued
+    from a thread pool — there is no ordering constraint, and
+    concurrent unlinks hide per-file round-trips on networked
+    filesystems in CI.
+    """
+    if not BUILD_DIR.exists():
+        return
+    artifacts = [a for a in BUILD_DIR.glob("**/*") if a.is_file()]
+    if not artifacts:
+        return
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        list(ex.map(Path.unlink, artifacts))
+    for artifact in artifacts:
+        log_info(f"removed {artifact.relative_to(STDLIB_DIR)}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument(
+        "--clean", action="store_true", help="remove build artifacts and exit"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="validate the layout without building"
+    )
+    args = parser.parse_args()
+
+    if args.clean:
+        clean_build()
+        return 0
+
+    module_stats = validate_modules(verbose=args.verbose)
+    if any(st is None for st in module_stats.values()):
+        return 1
+    if check_old_files():
+        return 1
+    generate_module_info()
+
+    if not args.check:
+        if not check_dependencies():
+            return 1
+        if not build_library(verbose=args.verbose):
+            return 1
+        if not build_examples(verbose=args.verbose):
+            return 1
+
+    log_info("module summary:")
+    for module, st in module_stats.items():
+        log_info(f"  {module}: {st.st_size} bytes")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())